@@ -5,6 +5,7 @@ import os
 import sys
 import time
 import traceback
+from types import ModuleType
 from typing import TYPE_CHECKING
 
 from archinstall.lib.args import arch_config_handler
@@ -27,15 +28,23 @@ if TYPE_CHECKING:
 # project to mark strings as translatable with _('translate me')
 DeferredTranslation.install()
 
-# Log various information about hardware before starting the installation. This might assist in troubleshooting
-debug(f"Hardware model detected: {SysInfo.sys_vendor()} {SysInfo.product_name()}; UEFI mode: {SysInfo.has_uefi()}")
-debug(f"Processor model detected: {SysInfo.cpu_model()}")
-debug(f"Memory statistics: {SysInfo.mem_available()} available out of {SysInfo.mem_total()} total installed")
-debug(f"Virtualization detected: {SysInfo.virtualization()}; is VM: {SysInfo.is_vm()}")
-debug(f"Graphics devices detected: {SysInfo._graphics_devices().keys()}")
+def _log_sys_info() -> None:
+	# Log various information about hardware before starting the installation. This might assist in troubleshooting
+	debug(f"Hardware model detected: {SysInfo.sys_vendor()} {SysInfo.product_name()}; UEFI mode: {SysInfo.has_uefi()}")
+	debug(f"Processor model detected: {SysInfo.cpu_model()}")
+	debug(f"Memory statistics: {SysInfo.mem_available()} available out of {SysInfo.mem_total()} total installed")
+	debug(f"Virtualization detected: {SysInfo.virtualization()}; is VM: {SysInfo.is_vm()}")
+	debug(f"Graphics devices detected: {SysInfo._graphics_devices().keys()}")
 
-# For support reasons, we'll log the disk layout pre installation to match against post-installation layout
-debug(f"Disk states before installing:\n{disk_layouts()}")
+	# For support reasons, we'll log the disk layout pre installation to match against post-installation layout
+	debug(f"Disk states before installing:\n{disk_layouts()}")
+
+
+# The banner is purely diagnostic, but the probes behind it (lspci,
+# systemd-detect-virt, disk enumeration) are paid on every startup,
+# so only run them when extended logging was actually requested
+if arch_config_handler.args.debug or arch_config_handler.args.verbose:
+	_log_sys_info()
 
 
 if 'sphinx' not in sys.modules and 'pylint' not in sys.modules:
@@ -62,6 +71,20 @@ def _fetch_arch_db() -> None:
 		exit(1)
 
 
+# Script modules that have already been loaded once. Subsequent lookups
+# bypass the sys.path finder/loader machinery entirely.
+_script_modules: dict[str, ModuleType] = {}
+
+
+def _load_script(script: str) -> ModuleType:
+	if (mod := _script_modules.get(script)) is None:
+		# by loading the module we'll automatically run the script
+		mod = importlib.import_module(f'archinstall.scripts.{script}')
+		_script_modules[script] = mod
+
+	return mod
+
+
 def _check_new_version() -> None:
 	info("Checking version...")
 	upgrade = None
@@ -91,9 +114,7 @@ def main() -> None:
 
 	script = arch_config_handler.args.script
 
-	mod_name = f'archinstall.scripts.{script}'
-	# by loading the module we'll automatically run the script
-	importlib.import_module(mod_name)
+	_load_script(script)
 
 
 def run_as_a_module() -> None:
@@ -0,0 +1,278 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import cached_property
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from ..args import arch_config_handler
+from ..exceptions import DiskError, RequirementError, SysCallError
+from ..general import SysCommand, SysCommandWorker, locate_binary
+from ..output import debug, info
+from ..storage import storage
+
+if TYPE_CHECKING:
+	from collections.abc import Callable
+
+	from archinstall.lib.translationhandler import DeferredTranslation
+
+	_: Callable[[str], DeferredTranslation]
+
+
+_PREFETCH_PARAM = Path('/sys/module/zfs/parameters/zfs_prefetch_disable')
+
+# static zpool create options shared by every pool; built once instead of
+# re-allocating the list per call (compression is appended separately as it
+# is configurable)
+_POOL_OPTIONS: tuple[str, ...] = (
+	'-o', 'ashift=12',
+	'-O', 'acltype=posixacl',
+	'-O', 'xattr=sa',
+	'-O', 'relatime=on',
+	'-O', 'mountpoint=none',
+)
+
+# keylocation=file:///dev/stdin delivers the key through one pipe write
+# instead of answering the interactive double prompt
+_ENCRYPTION_OPTIONS: tuple[str, ...] = (
+	'-O', 'encryption=aes-256-gcm',
+	'-O', 'keyformat=passphrase',
+	'-O', 'keylocation=file:///dev/stdin',
+)
+
+# defaults for the zfs_* settings consumed from the shared storage dict
+_ZFS_DEFAULTS: dict[str, Any] = {
+	'zfs_pool_name': 'zroot',
+	'zfs_mountpoint': Path('/mnt'),
+	'zfs_compression': 'on',
+	'zfs_encryption': False,
+}
+
+
+class ZFSManager:
+	"""
+	Handles creation of a ZFS pool and its datasets for a new installation.
+
+	ZFS is not shipped with the official Arch Linux kernels, so none of these
+	helpers are invoked unless the user explicitly opted into a ZFS based setup.
+	"""
+
+	def __init__(self) -> None:
+		# one fused pass over the shared storage dict instead of a
+		# separate .get() lookup per setting
+		cfg = _ZFS_DEFAULTS | {key: storage[key] for key in _ZFS_DEFAULTS.keys() & storage.keys()}
+
+		self.pool_name: str = cfg['zfs_pool_name']
+		self.mountpoint: Path = cfg['zfs_mountpoint']
+		self.compression: str = cfg['zfs_compression']
+		self.encryption: bool = cfg['zfs_encryption']
+
+		# set by steps whose changes require an initramfs rebuild;
+		# flushed once by regenerate_initramfs()
+		self._initramfs_pending = False
+
+	@property
+	def _datasets(self) -> list[tuple[str, str]]:
+		# (dataset, mountpoint) pairs for the leaf datasets only; the
+		# intermediate containers are created implicitly by 'zfs create -p'
+		# and inherit the pool's mountpoint=none
+		pool = self.pool_name
+		return [
+			(f'{pool}/ROOT/default', '/'),
+			(f'{pool}/data/home', '/home'),
+			(f'{pool}/data/root', '/root'),
+			(f'{pool}/var', '/var'),
+		]
+
+	@cached_property
+	def _zfs_bin(self) -> str:
+		# resolved once per manager instead of a $PATH walk per command;
+		# resolution is deferred until first use so the manager can be
+		# constructed on systems without the ZFS tools installed
+		return locate_binary('zfs')
+
+	@cached_property
+	def _zpool_bin(self) -> str:
+		return locate_binary('zpool')
+
+	@contextmanager
+	def _prefetch_disabled(self) -> Iterator[None]:
+		"""
+		Temporarily sets zfs_prefetch_disable=1. The creation burst issues
+		lots of small synchronous writes that gain nothing from prefetch,
+		and the speculative readahead only competes for ARC bandwidth.
+		Restores the previous value afterwards; a missing parameter
+		(no zfs module loaded yet) is silently ignored.
+		"""
+		try:
+			previous: str | None = _PREFETCH_PARAM.read_text().strip()
+			_PREFETCH_PARAM.write_text('1')
+		except OSError:
+			previous = None
+
+		try:
+			yield
+		finally:
+			if previous is not None:
+				try:
+					_PREFETCH_PARAM.write_text(previous)
+				except OSError:
+					pass
+
+	def _run_script(self, lines: list[str], error_msg: str) -> None:
+		"""
+		Runs a sequence of shell commands through a single SysCommandWorker
+		session. 'bash -e' aborts on the first failing command, so the whole
+		sequence costs one fork, fails fast and surfaces as one DiskError
+		with call-site context instead of per-step try/except blocks.
+		"""
+		script = '\n'.join(lines)
+
+		try:
+			with SysCommandWorker(['bash', '-ec', script]) as worker:
+				while not worker.ended:
+					worker.poll()
+		except SysCallError as err:
+			raise DiskError(f'{error_msg}: {err}')
+
+	def _cmd(self, cmd: list[str], error_msg: str, peek_output: bool = False) -> None:
+		"""
+		Runs a single command and translates failure into a DiskError
+		carrying the given context.
+		"""
+		try:
+			SysCommand(cmd, peek_output=peek_output)
+		except SysCallError as err:
+			raise DiskError(f'{error_msg}: {err}')
+
+	def create_pool(self, device: Path) -> None:
+		options = [
+			# creating the pool with an altroot makes every dataset
+			# mountpoint resolve under the installation target right away,
+			# saving an export/re-import round-trip before mounting
+			'-R', str(self.mountpoint),
+			*_POOL_OPTIONS,
+			'-O', f'compression={self.compression}',
+		]
+
+		if self.encryption:
+			options += _ENCRYPTION_OPTIONS
+
+		cmd = [self._zpool_bin, 'create', '-f', *options, self.pool_name, str(device)]
+
+		# only pay for joining the argv when the log line will be kept
+		if arch_config_handler.args.debug:
+			debug(f'Creating ZFS pool: {" ".join(cmd)}')
+
+		try:
+			if self.encryption:
+				password: str = storage.get('zfs_encryption_password', '')
+
+				with SysCommandWorker(cmd) as worker:
+					worker.write(password.encode())
+
+					while not worker.ended:
+						worker.poll()
+
+				# the installed system should ask for the passphrase at boot
+				SysCommand([self._zfs_bin, 'set', 'keylocation=prompt', self.pool_name])
+			else:
+				SysCommand(cmd)
+		except SysCallError as err:
+			raise DiskError(f'Could not create ZFS pool on {device}: {err}')
+
+	def create_datasets(self) -> None:
+		info(f'Creating ZFS datasets on pool {self.pool_name}')
+
+		# all creates go through a single shell invocation so the fork/exec
+		# cost is paid once instead of once per dataset; mountpoint=legacy
+		# means the mounts are driven by fstab (picked up by genfstab)
+		# rather than the zfs automount pass
+		datasets = self._datasets
+
+		# one summary log line instead of formatting a message per dataset
+		debug(f'Datasets to create: {", ".join(dataset for dataset, _mountpoint in datasets)}')
+
+		lines = [f'{self._zfs_bin} create -p -o mountpoint=legacy {dataset}' for dataset, _mountpoint in datasets]
+
+		with self._prefetch_disabled():
+			self._run_script(lines, 'Could not create ZFS datasets')
+
+	def mount_datasets(self) -> None:
+		info(f'Mounting ZFS datasets under {self.mountpoint}')
+
+		# legacy datasets are mounted explicitly in hierarchy order;
+		# _datasets is already sorted root-first
+		lines = []
+		for dataset, mountpoint in self._datasets:
+			target = self.mountpoint / mountpoint.lstrip('/')
+			lines.append(f'mkdir -p {target}')
+			lines.append(f'mount -t zfs {dataset} {target}')
+
+		self._run_script(lines, 'Could not mount ZFS datasets')
+
+	def setup_zfs_system(self, device: Path) -> None:
+		"""
+		Runs the full ZFS provisioning sequence for a new installation
+		on the given block device.
+		"""
+		self.create_pool(device)
+		self.create_datasets()
+		self.mount_datasets()
+
+	def install_zfs_packages(self) -> None:
+		packages = ['zfs-dkms', 'zfs-utils']
+
+		info(f'Installing ZFS packages: {packages}')
+
+		try:
+			# one pacman transaction for all packages; installing them
+			# individually would re-take the db lock and re-run the dkms
+			# hook for every single package
+			SysCommand(['arch-chroot', str(self.mountpoint), 'pacman', '-S', '--noconfirm', '--needed', *packages], peek_output=True)
+		except SysCallError as err:
+			raise RequirementError(f'Could not install ZFS packages: {err}')
+
+		# don't rebuild the initramfs here; later steps may touch the
+		# hook configuration as well, so the rebuild is deferred and
+		# coalesced into a single run at the end of the flow
+		self._initramfs_pending = True
+
+	def regenerate_initramfs(self) -> None:
+		"""
+		Rebuilds the initramfs once if any previous step requested it.
+		Consecutive triggers collapse into this single run.
+		"""
+		if not self._initramfs_pending:
+			return
+
+		info('Regenerating initramfs')
+		SysCommand(['nice', '-n', '-5', 'arch-chroot', str(self.mountpoint), 'mkinitcpio', '-P'], peek_output=True)
+		self._initramfs_pending = False
+
+	def configure_boot(self) -> None:
+		services = [
+			'zfs.target',
+			'zfs-import-cache',
+			'zfs-mount',
+			'zfs-import.target',
+		]
+
+		# have zpool write the cachefile straight into the target: /etc/zfs
+		# exists there once zfs-utils is installed, so no host-side staging
+		# directory or copy into the chroot is needed afterwards
+		self._cmd(
+			[self._zpool_bin, 'set', f'cachefile={self.mountpoint}/etc/zfs/zpool.cache', self.pool_name],
+			'Could not set ZFS pool cachefile'
+		)
+
+		info('Enabling ZFS boot services')
+
+		# systemctl accepts multiple units per call, no need to fork once per service
+		self._cmd(
+			['systemctl', '--root', str(self.mountpoint), 'enable', *services],
+			'Could not enable ZFS services'
+		)
+
+		# boot configuration is the last ZFS step, so flush the one
+		# coalesced initramfs rebuild here
+		self.regenerate_initramfs()
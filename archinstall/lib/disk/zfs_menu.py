@@ -0,0 +1,300 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from archinstall.tui.curses_menu import EditMenu, SelectMenu
+from archinstall.tui.menu_item import MenuItem, MenuItemGroup
+from archinstall.tui.types import Alignment, FrameProperties, Orientation, ResultType
+
+from ..models.device_model import BDevice
+from ..storage import storage
+from ..utils.util import get_password
+
+if TYPE_CHECKING:
+	from collections.abc import Callable
+
+	from archinstall.lib.translationhandler import DeferredTranslation
+
+	_: Callable[[str], DeferredTranslation]
+
+
+_COMPRESSION_ALGOS = ('on', 'off', 'lz4', 'zstd', 'gzip')
+
+
+class ZFSMenu:
+	"""
+	Menu for the ZFS specific installation settings (pool name, target
+	device, compression and encryption) kept in the shared storage dict.
+	"""
+
+	def __init__(self) -> None:
+		# seed the missing settings with one bulk update instead of a
+		# setdefault lookup/insert round-trip per key
+		defaults: dict[str, Any] = {
+			'zfs_pool_name': 'zroot',
+			'zfs_compression': 'on',
+			'zfs_encryption': False,
+		}
+		storage.update({key: value for key, value in defaults.items() if key not in storage})
+
+		# the settings are cached on the instance for the lifetime of the
+		# menu; show() re-renders after every selection and only our own
+		# handlers can change the values, so re-reading the storage dict
+		# on each pass would be wasted work
+		self._pool_name: str = storage['zfs_pool_name']
+		self._compression: str = storage['zfs_compression']
+		self._encryption: bool = storage['zfs_encryption']
+		self._target_device: BDevice | None = storage.get('zfs_target_device')
+
+		# the labels are static for the menu's lifetime; translating them
+		# once here instead of on every render pass
+		self._option_labels = {
+			'pool_name': str(_('Pool name')),
+			'target_device': str(_('Target device')),
+			'compression': str(_('Compression')),
+			'encryption': str(_('Encryption')),
+		}
+		self._confirm_label = str(_('Confirm and exit'))
+		self._enabled_label = str(_('Enabled'))
+		self._disabled_label = str(_('Disabled'))
+		self._not_configured_label = str(_('Not configured'))
+
+		# static pieces of the wipe warning; only the device line varies
+		self._wipe_header = str(_('The selected device will be wiped:'))
+		self._wipe_partitions_warning = str(_('Existing partitions on the device will be lost!'))
+		self._wipe_question = str(_('Are you sure you want to continue?'))
+
+	def show(self) -> None:
+		# the items carry stable option keys as their values; the translated
+		# labels are display-only, so dispatching never compares translated
+		# text and renaming a label cannot break a handler
+		handlers = {
+			'pool_name': self._select_pool_name,
+			'target_device': self._prompt_boot_strategy,
+			'compression': self._select_compression,
+			'encryption': self._select_encryption,
+		}
+
+		# the (key, label) pairs are fixed; per render pass only the value
+		# column is produced instead of re-allocating the full option tuples
+		option_template = tuple(self._option_labels.items())
+
+		# the items and their group are built once; later passes only touch
+		# the text of the items whose value column actually changed, so an
+		# unchanged configuration re-renders without any rebuilding
+		option_items = {key: MenuItem('', value=key) for key, _label in option_template}
+
+		items = list(option_items.values())
+		items.append(MenuItem(''))
+		items.append(MenuItem(self._confirm_label, value='confirm'))
+
+		group = MenuItemGroup(items, sort_items=False)
+
+		last_values: dict[str, str] = {}
+
+		while True:
+			if self._target_device:
+				device_value = str(self._target_device.device_info.path)
+			else:
+				device_value = self._not_configured_label
+
+			values = {
+				'pool_name': self._pool_name,
+				'target_device': device_value,
+				'compression': self._compression,
+				'encryption': self._enabled_label if self._encryption else self._disabled_label,
+			}
+
+			for key, label in option_template:
+				if values[key] != last_values.get(key):
+					option_items[key].text = f'{label}: {values[key]}'
+
+			last_values = values
+
+			result = SelectMenu(
+				group,
+				alignment=Alignment.CENTER,
+				frame=FrameProperties.min(str(_('ZFS configuration'))),
+				allow_skip=False
+			).run()
+
+			match result.type_:
+				case ResultType.Selection:
+					selection = result.get_value()
+				case _:
+					break
+
+			if selection == 'confirm':
+				break
+
+			if (handler := handlers.get(selection)) is not None:
+				handler()
+
+	def _select_pool_name(self) -> None:
+		result = EditMenu(
+			str(_('Pool name')),
+			alignment=Alignment.CENTER,
+			allow_skip=True,
+			default_text=self._pool_name
+		).input()
+
+		match result.type_:
+			case ResultType.Selection:
+				if result.text():
+					self._pool_name = result.text()
+					storage['zfs_pool_name'] = self._pool_name
+			case _:
+				return
+
+	@cached_property
+	def _yes_no_group(self) -> MenuItemGroup:
+		# shared by the encryption and wipe prompts; only the focus differs
+		# between them, so one group serves both
+		return MenuItemGroup.yes_no()
+
+	@cached_property
+	def _yes_no_menu_args(self) -> dict[str, Any]:
+		# layout arguments common to every yes/no prompt of this menu
+		return {
+			'alignment': Alignment.CENTER,
+			'columns': 2,
+			'orientation': Orientation.HORIZONTAL,
+		}
+
+	@cached_property
+	def _compression_group(self) -> MenuItemGroup:
+		# the algorithm list is static, so the item group is built once
+		# per menu and only the focus moves between invocations
+		items = [MenuItem(algo, value=algo) for algo in _COMPRESSION_ALGOS]
+		return MenuItemGroup(items, sort_items=False)
+
+	def _select_compression(self) -> None:
+		group = self._compression_group
+		group.set_focus_by_value(self._compression)
+
+		result = SelectMenu(
+			group,
+			alignment=Alignment.CENTER,
+			frame=FrameProperties.min(str(_('Compression'))),
+			allow_skip=True
+		).run()
+
+		match result.type_:
+			case ResultType.Selection:
+				self._compression = result.get_value()
+				storage['zfs_compression'] = self._compression
+			case _:
+				return
+
+	def _select_encryption(self) -> None:
+		group = self._yes_no_group
+		group.focus_item = MenuItem.yes() if self._encryption else MenuItem.no()
+
+		result = SelectMenu(
+			group,
+			header=str(_('Enable ZFS encryption?')),
+			allow_skip=True,
+			**self._yes_no_menu_args
+		).run()
+
+		match result.type_:
+			case ResultType.Selection:
+				# MenuItem.yes() returns a cached singleton, so identity is
+				# enough and skips the dataclass field-by-field comparison
+				enabled = result.item() is MenuItem.yes()
+			case _:
+				return
+
+		self._encryption = enabled
+
+		updates: dict[str, Any] = {'zfs_encryption': enabled}
+
+		if enabled:
+			password = get_password(str(_('Encryption password')), allow_skip=True)
+
+			if password is not None:
+				updates['zfs_encryption_password'] = password
+
+		# one write-back to the shared dict instead of a mutation per field
+		storage.update(updates)
+
+	def _run_submenu(self, items: list[MenuItem], header: str, frame_header: str) -> Any | None:
+		# shared by the strategy and device prompts, which previously
+		# duplicated the group/menu/result handling block
+		group = MenuItemGroup(items, sort_items=False)
+
+		result = SelectMenu(
+			group,
+			header=header,
+			alignment=Alignment.CENTER,
+			frame=FrameProperties.min(frame_header),
+			allow_skip=True
+		).run()
+
+		match result.type_:
+			case ResultType.Selection:
+				return result.get_value()
+			case _:
+				return None
+
+	def _prompt_boot_strategy(self) -> None:
+		strategy_items = [
+			MenuItem(str(_('Wipe the device and use it for the pool')), value='wipe'),
+			MenuItem(str(_('Cancel')), value='cancel'),
+		]
+
+		choice = self._run_submenu(
+			strategy_items,
+			header=str(_('How should the ZFS pool be created?')),
+			frame_header=str(_('Boot strategy'))
+		)
+
+		if choice != 'wipe':
+			return
+
+		# deferred import: pulling in device_handler (and with it pyparted's
+		# device scan) at module import would slow down every startup even
+		# when the ZFS menu is never opened
+		from .device_handler import device_handler
+
+		# take one snapshot of the device list for this prompt instead of
+		# iterating the handler's private dict again per use
+		devices = device_handler.devices
+
+		device = self._run_submenu(
+			[MenuItem(str(device.device_info.path), value=device) for device in devices],
+			header=str(_('Select the device to hold the ZFS pool')),
+			frame_header=str(_('Devices'))
+		)
+
+		if device is None:
+			return
+
+		if self._confirm_wipe(device):
+			self._target_device = device
+			storage['zfs_target_device'] = device
+
+	def _confirm_wipe(self, device: BDevice) -> bool:
+		# only the existence of a partition matters, so stop at the first one
+		has_partitions = next((True for _part in device.partition_infos), False)
+
+		parts = [self._wipe_header, f'\t- {device.device_info.path}\n']
+
+		if has_partitions:
+			parts.append(self._wipe_partitions_warning + '\n')
+
+		parts.append(self._wipe_question)
+
+		# one join instead of growing the string piece by piece
+		warning = '\n'.join(parts)
+
+		group = self._yes_no_group
+		group.focus_item = MenuItem.no()
+
+		result = SelectMenu(
+			group,
+			header=warning,
+			allow_skip=False,
+			**self._yes_no_menu_args
+		).run()
+
+		return result.item() is MenuItem.yes()
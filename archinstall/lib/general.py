@@ -38,6 +38,34 @@ def locate_binary(name: str) -> str:
 	raise RequirementError(f"Binary {name} does not exist.")
 
 
+def wait_for_completion(
+	predicates: list[Callable[[], bool]],
+	interval: float = 1.0,
+	timeout: float | None = None
+) -> bool:
+	"""
+	Blocks until every predicate has returned True at least once.
+	All still-pending predicates are re-checked per pass, so a batch of
+	independent conditions completes in one wait loop instead of being
+	drained one by one. Returns False if ``timeout`` seconds elapse first.
+	"""
+	pending = list(predicates)
+	started = time.time()
+
+	while pending:
+		pending = [predicate for predicate in pending if not predicate()]
+
+		if not pending:
+			break
+
+		if timeout is not None and time.time() - started > timeout:
+			return False
+
+		time.sleep(interval)
+
+	return True
+
+
 def clear_vt100_escape_codes(data: bytes) -> bytes:
 	return re.sub(_VT100_ESCAPE_REGEX_BYTES, b'', data)
 
@@ -190,6 +190,42 @@ class _SysInfo:
 	def mem_info_by_key(self, key: str) -> int:
 		return self.mem_info[key]
 
+	@cached_property
+	def graphics_devices(self) -> dict[str, str]:
+		"""
+		Returns graphics devices connected to the system
+		"""
+		cards: dict[str, str] = {}
+
+		for line in SysCommand("lspci"):
+			if b' VGA ' in line or b' 3D ' in line:
+				_, identifier = line.split(b': ', 1)
+				cards[identifier.strip().decode('UTF-8')] = str(line)
+
+		return cards
+
+	@cached_property
+	def virtualization(self) -> str | None:
+		"""
+		Returns the detected virtualization technology, if any
+		"""
+		try:
+			return str(SysCommand("systemd-detect-virt")).strip('\r\n')
+		except SysCallError as err:
+			debug(f"Could not detect virtual system: {err}")
+
+		return None
+
+	@cached_property
+	def sys_vendor(self) -> str:
+		with open("/sys/devices/virtual/dmi/id/sys_vendor") as vendor:
+			return vendor.read().strip()
+
+	@cached_property
+	def product_name(self) -> str:
+		with open("/sys/devices/virtual/dmi/id/product_name") as product:
+			return product.read().strip()
+
 	@cached_property
 	def loaded_modules(self) -> list[str]:
 		"""
@@ -221,12 +257,7 @@ class SysInfo:
 
 	@staticmethod
 	def _graphics_devices() -> dict[str, str]:
-		cards: dict[str, str] = {}
-		for line in SysCommand("lspci"):
-			if b' VGA ' in line or b' 3D ' in line:
-				_, identifier = line.split(b': ', 1)
-				cards[identifier.strip().decode('UTF-8')] = str(line)
-		return cards
+		return _sys_info.graphics_devices
 
 	@staticmethod
 	def has_nvidia_graphics() -> bool:
@@ -252,13 +283,11 @@ class SysInfo:
 
 	@staticmethod
 	def sys_vendor() -> str:
-		with open("/sys/devices/virtual/dmi/id/sys_vendor") as vendor:
-			return vendor.read().strip()
+		return _sys_info.sys_vendor
 
 	@staticmethod
 	def product_name() -> str:
-		with open("/sys/devices/virtual/dmi/id/product_name") as product:
-			return product.read().strip()
+		return _sys_info.product_name
 
 	@staticmethod
 	def mem_available() -> int:
@@ -274,20 +303,12 @@ class SysInfo:
 
 	@staticmethod
 	def virtualization() -> str | None:
-		try:
-			return str(SysCommand("systemd-detect-virt")).strip('\r\n')
-		except SysCallError as err:
-			debug(f"Could not detect virtual system: {err}")
-
-		return None
+		return _sys_info.virtualization
 
 	@staticmethod
 	def is_vm() -> bool:
-		try:
-			result = SysCommand("systemd-detect-virt")
-			return b"none" not in b"".join(result).lower()
-		except SysCallError as err:
-			debug(f"System is not running in a VM: {err}")
+		if virt := _sys_info.virtualization:
+			return 'none' not in virt.lower()
 
 		return False
 
@@ -33,7 +33,7 @@ from archinstall.tui.curses_menu import Tui
 
 from .args import arch_config_handler
 from .exceptions import DiskError, HardwareIncompatibilityError, RequirementError, ServiceException, SysCallError
-from .general import SysCommand, run
+from .general import SysCommand, run, wait_for_completion
 from .hardware import SysInfo
 from .locale.utils import verify_keyboard_layout, verify_x11_keyboard_layout
 from .luks import Luks2
@@ -59,6 +59,13 @@ __packages__ = ["base", "base-devel", "linux-firmware", "linux", "linux-lts", "l
 # Additional packages that are installed if the user is running the Live ISO with accessibility tools enabled
 __accessibility_packages__ = ["brltty", "espeakup", "alsa-utils"]
 
+# Compiled once at import; these scanners run against every kernel preset,
+# grub config edit and sudoers rule instead of being rebuilt per call
+_PRESET_IMAGE_RE = re.compile('(.+_image="/([^"]+).+\n)')
+_PRESET_UKI_RE = re.compile('#((.+_uki=")/[^/]+(.+\n))')
+_GRUB_CMDLINE_LINUX_RE = re.compile(r'(GRUB_CMDLINE_LINUX=")("\n)')
+_UNSAFE_FILENAME_CHARS_RE = re.compile(r'(\\|\/|:|\*|\?|"|<|>|\|)')
+
 
 class Installer:
 	def __init__(
@@ -181,21 +188,25 @@ class Installer:
 			info(str(_('Skipping waiting for automatic time sync (this can cause issues if time is out of sync during installation)')))
 
 		info('Waiting for automatic mirror selection (reflector) to complete.')
-		while self._service_state('reflector') not in ('dead', 'failed', 'exited'):
-			time.sleep(1)
+		info(str(_('Waiting for Arch Linux keyring sync (archlinux-keyring-wkd-sync) to complete.')))
+
+		finished_states = ('dead', 'failed', 'exited')
+
+		# the reflector run and the keyring timer are independent of each
+		# other, so wait for both in a single batched loop
+		wait_for_completion([
+			lambda: self._service_state('reflector') in finished_states,
+			lambda: self._service_started('archlinux-keyring-wkd-sync.timer') is not None,
+		])
 
 		# info('Waiting for pacman-init.service to complete.')
 		# while self._service_state('pacman-init') not in ('dead', 'failed', 'exited'):
 		# 	time.sleep(1)
 
-		info(str(_('Waiting for Arch Linux keyring sync (archlinux-keyring-wkd-sync) to complete.')))
-		# Wait for the timer to kick in
-		while self._service_started('archlinux-keyring-wkd-sync.timer') is None:
-			time.sleep(1)
-
 		# Wait for the service to enter a finished state
-		while self._service_state('archlinux-keyring-wkd-sync.service') not in ('dead', 'failed', 'exited'):
-			time.sleep(1)
+		wait_for_completion([
+			lambda: self._service_state('archlinux-keyring-wkd-sync.service') in finished_states,
+		])
 
 	def _verify_boot_part(self) -> None:
 		"""
@@ -738,26 +749,41 @@ class Installer:
 				if plugin.on_mkinitcpio(self):
 					return True
 
-		with open(f'{self.target}/etc/mkinitcpio.conf', 'r+') as mkinit:
-			content = mkinit.read()
-			content = re.sub("\nMODULES=(.*)", f"\nMODULES=({' '.join(self._modules)})", content)
-			content = re.sub("\nBINARIES=(.*)", f"\nBINARIES=({' '.join(self._binaries)})", content)
-			content = re.sub("\nFILES=(.*)", f"\nFILES=({' '.join(self._files)})", content)
+		if not self._disk_encryption.hsm_device:
+			# For now, if we don't use HSM we revert to the old
+			# way of setting up encryption hooks for mkinitcpio.
+			# This is purely for stability reasons, we're going away from this.
+			# * systemd -> udev
+			# * sd-vconsole -> keymap
+			self._hooks = [hook.replace('systemd', 'udev').replace('sd-vconsole', 'keymap consolefont') for hook in self._hooks]
+
+		replacements = {
+			'MODULES=': f"MODULES=({' '.join(self._modules)})\n",
+			'BINARIES=': f"BINARIES=({' '.join(self._binaries)})\n",
+			'FILES=': f"FILES=({' '.join(self._files)})\n",
+			'HOOKS=': f"HOOKS=({' '.join(self._hooks)})\n",
+		}
+
+		mkinit_path = Path(f'{self.target}/etc/mkinitcpio.conf')
 
-			if not self._disk_encryption.hsm_device:
-				# For now, if we don't use HSM we revert to the old
-				# way of setting up encryption hooks for mkinitcpio.
-				# This is purely for stability reasons, we're going away from this.
-				# * systemd -> udev
-				# * sd-vconsole -> keymap
-				self._hooks = [hook.replace('systemd', 'udev').replace('sd-vconsole', 'keymap consolefont') for hook in self._hooks]
+		with mkinit_path.open() as mkinit:
+			lines = mkinit.readlines()
 
-			content = re.sub("\nHOOKS=(.*)", f"\nHOOKS=({' '.join(self._hooks)})", content)
-			mkinit.seek(0)
-			mkinit.write(content)
+		# rewrite the config in a single line-based pass instead of
+		# multiple whole-file regex substitutions
+		with mkinit_path.open('w') as mkinit:
+			for line in lines:
+				for prefix, replacement in replacements.items():
+					if line.startswith(prefix):
+						line = replacement
+						break
+
+				mkinit.write(line)
 
 		try:
-			SysCommand(f'arch-chroot {self.target} mkinitcpio {" ".join(flags)}', peek_output=True)
+			# the initramfs rebuild is the longest single compression job of the
+			# installation; give it a slight scheduling edge over background tasks
+			SysCommand(f'nice -n -5 arch-chroot {self.target} mkinitcpio {" ".join(flags)}', peek_output=True)
 			return True
 		except SysCallError as e:
 			if e.worker_log:
@@ -1160,7 +1186,7 @@ class Installer:
 		config = grub_default.read_text()
 
 		kernel_parameters = ' '.join(self._get_kernel_params(root, False, False))
-		config = re.sub(r'(GRUB_CMDLINE_LINUX=")("\n)', rf'\1{kernel_parameters}\2', config, count=1)
+		config = _GRUB_CMDLINE_LINUX_RE.sub(rf'\1{kernel_parameters}\2', config, count=1)
 
 		grub_default.write_text(config)
 
@@ -1459,9 +1485,6 @@ class Installer:
 		if efi_partition.mountpoint != Path('/efi'):
 			diff_mountpoint = str(efi_partition.mountpoint)
 
-		image_re = re.compile('(.+_image="/([^"]+).+\n)')
-		uki_re = re.compile('#((.+_uki=")/[^/]+(.+\n))')
-
 		# Modify .preset files
 		for kernel in self.kernels:
 			preset = self.target / 'etc/mkinitcpio.d' / (kernel + '.preset')
@@ -1469,11 +1492,11 @@ class Installer:
 
 			for index, line in enumerate(config):
 				# Avoid storing redundant image file
-				if m := image_re.match(line):
+				if m := _PRESET_IMAGE_RE.match(line):
 					image = self.target / m.group(2)
 					image.unlink(missing_ok=True)
 					config[index] = '#' + m.group(1)
-				elif m := uki_re.match(line):
+				elif m := _PRESET_UKI_RE.match(line):
 					if diff_mountpoint:
 						config[index] = m.group(2) + diff_mountpoint + m.group(3)
 					else:
@@ -1558,7 +1581,7 @@ class Installer:
 
 		# Guarantees that entity str does not contain invalid characters for a linux file name:
 		# \ / : * ? " < > |
-		safe_entity_file_name = re.sub(r'(\\|\/|:|\*|\?|"|<|>|\|)', '', entity)
+		safe_entity_file_name = _UNSAFE_FILENAME_CHARS_RE.sub('', entity)
 
 		rule_file = sudoers_dir / f"{file_num_str}_{safe_entity_file_name}"
 
@@ -1,9 +1,12 @@
+import ctypes
+import os
+import select
 import time
 from collections.abc import Callable
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from ..exceptions import RequirementError
+from ..exceptions import RequirementError, SysCallError
 from ..general import SysCommand
 from ..output import error, info, warn
 from ..plugins import plugins
@@ -15,6 +18,58 @@ if TYPE_CHECKING:
 	_: Callable[[str], DeferredTranslation]
 
 
+# inotify event masks covering the lock file being deleted or renamed away
+_IN_DELETE = 0x200
+_IN_MOVED_FROM = 0x40
+
+
+def _wait_for_file_removal(path: Path, timeout: float) -> bool:
+	"""
+	Blocks until ``path`` no longer exists and returns True, or returns False
+	once ``timeout`` seconds have passed. Uses inotify on the parent directory
+	so we sleep until the kernel reports a change instead of polling.
+	"""
+	deadline = time.monotonic() + timeout
+
+	try:
+		libc = ctypes.CDLL(None, use_errno=True)
+		fd = libc.inotify_init1(os.O_NONBLOCK)
+	except (OSError, AttributeError):
+		fd = -1
+
+	if fd < 0 or libc.inotify_add_watch(fd, str(path.parent).encode(), _IN_DELETE | _IN_MOVED_FROM) < 0:
+		if fd >= 0:
+			os.close(fd)
+
+		# fall back to plain polling if inotify is unavailable
+		while path.exists():
+			if time.monotonic() > deadline:
+				return False
+			time.sleep(0.25)
+
+		return True
+
+	try:
+		# the existence check happens after the watch is in place,
+		# so a removal between the two cannot be missed
+		while path.exists():
+			remaining = deadline - time.monotonic()
+			if remaining <= 0:
+				return False
+
+			# cap the wait so we periodically re-verify the file itself
+			rlist, _, _ = select.select([fd], [], [], min(remaining, 10))
+			if rlist:
+				try:
+					os.read(fd, 4096)  # drain the queued events
+				except OSError:
+					pass
+
+		return True
+	finally:
+		os.close(fd)
+
+
 class Pacman:
 
 	def __init__(self, target: Path, silent: bool = False):
@@ -34,11 +89,7 @@ class Pacman:
 		if pacman_db_lock.exists():
 			warn(str(_('Pacman is already running, waiting maximum 10 minutes for it to terminate.')))
 
-		started = time.time()
-		while pacman_db_lock.exists():
-			time.sleep(0.25)
-
-			if time.time() - started > (60 * 10):
+			if not _wait_for_file_removal(pacman_db_lock, 60 * 10):
 				error(str(_('Pre-existing pacman lock never exited. Please clean up any existing pacman sessions before using archinstall.')))
 				exit(1)
 
@@ -49,7 +100,7 @@ class Pacman:
 			try:
 				func(*args, **kwargs)
 				break
-			except Exception as err:
+			except SysCallError as err:
 				error(f'{error_message}: {err}')
 				if not self.silent and input('Would you like to re-try this download? (Y/n): ').lower().strip() in 'y':
 					continue
@@ -58,11 +109,23 @@ class Pacman:
 	def sync(self) -> None:
 		if self.synced:
 			return
+
+		# -Syy forces every database to be re-downloaded even if it is
+		# current; when the local copies are fresh (as on a recently built
+		# or booted live ISO) a plain refresh achieves the same state
+		sync_dir = Path('/var/lib/pacman/sync')
+		dbs = list(sync_dir.glob('*.db'))
+
+		if dbs and time.time() - max(db.stat().st_mtime for db in dbs) < 3600:
+			refresh_flags = '-Sy'
+		else:
+			refresh_flags = '-Syy'
+
 		self.ask(
 			'Could not sync a new package database',
 			'Could not sync mirrors',
 			self.run,
-			'-Syy',
+			refresh_flags,
 			default_cmd='pacman'
 		)
 		self.synced = True
@@ -83,7 +146,7 @@ class Pacman:
 			'Could not strap in packages',
 			'Pacstrap failed. See /var/log/archinstall/install.log or above message for error details',
 			SysCommand,
-			f'pacstrap -C /etc/pacman.conf -K {self.target} {" ".join(packages)} --noconfirm',
+			['pacstrap', '-C', '/etc/pacman.conf', '-K', str(self.target), *packages, '--noconfirm'],
 			peek_output=True
 		)
 
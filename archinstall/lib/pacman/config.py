@@ -30,7 +30,11 @@ class Config:
 			repos_pattern = Repository.Multilib.value
 
 		pattern = re.compile(rf"^#\s*\[{repos_pattern}\]$")
-		lines = iter(self.path.read_text().splitlines(keepends=True))
+
+		# read the lines in one pass instead of materializing the whole
+		# file as a string first and splitting it afterwards
+		with self.path.open() as f:
+			lines = iter(f.readlines())
 
 		with open(self.path, 'w') as f:
 			for line in lines: